@@ -17,6 +17,23 @@ class PluginRegistryError(Exception):
     pass
 
 
+# Plugin attribute under which subclasses (for types) or instances (for everything else)
+# of each base class are registered; entries are checked in order
+_TYPE_ATTRIBUTES = {
+    AbstractType: "abstract_types",
+    ConcreteType: "concrete_types",
+    Wrapper: "wrappers",
+}
+_INSTANCE_ATTRIBUTES = {
+    Translator: "translators",
+    AbstractAlgorithm: "abstract_algorithms",
+    ConcreteAlgorithm: "concrete_algorithms",
+    Compiler: "compilers",
+}
+_PLUGIN_TYPES = tuple(_TYPE_ATTRIBUTES)
+_PLUGIN_INSTANCE_TYPES = tuple(_INSTANCE_ATTRIBUTES)
+
+
 class PluginRegistry:
     """
     PluginRegistry for use by libraries implementing new types, translators, and algorithms for metagraph.
@@ -99,25 +116,19 @@ class PluginRegistry:
             return
 
         if isinstance(obj, type):
-            if issubclass(obj, AbstractType):
-                _add_obj(name, "abstract_types", obj)
-            elif issubclass(obj, ConcreteType):
-                _add_obj(name, "concrete_types", obj)
-            elif issubclass(obj, Wrapper):
-                _add_obj(name, "wrappers", obj)
+            for base, attribute in _TYPE_ATTRIBUTES.items():
+                if issubclass(obj, base):
+                    _add_obj(name, attribute, obj)
+                    break
             else:
                 raise PluginRegistryError(
                     f"Invalid type for plugin registry: {obj}", obj
                 )
         else:
-            if isinstance(obj, Translator):
-                _add_obj(name, "translators", obj)
-            elif isinstance(obj, AbstractAlgorithm):
-                _add_obj(name, "abstract_algorithms", obj)
-            elif isinstance(obj, ConcreteAlgorithm):
-                _add_obj(name, "concrete_algorithms", obj)
-            elif isinstance(obj, Compiler):
-                _add_obj(name, "compilers", obj)
+            for base, attribute in _INSTANCE_ATTRIBUTES.items():
+                if isinstance(obj, base):
+                    _add_obj(name, attribute, obj)
+                    break
             else:
                 raise PluginRegistryError(
                     f"Invalid object for plugin registry: {type(obj)}"
@@ -148,22 +159,24 @@ class PluginRegistry:
 
         # If requested, we could break this out into a function that yields items.
         def _register_module(module, *, recurse, base_name, seen_modules):
+            submodule_prefix = base_name + "."
             for key, val in vars(module).items():
                 if key.startswith("_"):
                     continue
                 if isinstance(val, type):
+                    # Cheap module name check first; most classes in a namespace are
+                    # imported from elsewhere (numpy, pandas, ...) and get rejected here
+                    module_name = getattr(val, "__module__", None) or ""
                     if (
-                        issubclass(val, (Wrapper, ConcreteType, AbstractType))
-                        and (
-                            val.__module__ == base_name
-                            or val.__module__.startswith(base_name + ".")
+                        (
+                            module_name == base_name
+                            or module_name.startswith(submodule_prefix)
                         )
-                        and val not in {Wrapper, ConcreteType, AbstractType}
+                        and val not in _TYPE_ATTRIBUTES
+                        and issubclass(val, _PLUGIN_TYPES)
                     ):
                         self.register(val, name)
-                elif isinstance(
-                    val, (Translator, ConcreteAlgorithm, AbstractAlgorithm, Compiler)
-                ):
+                elif isinstance(val, _PLUGIN_INSTANCE_TYPES):
                     # if val.__wrapped__.__module__.startswith(base_name):  # maybe?
                     self.register(val, name)
                 elif (
@@ -1,7 +1,8 @@
 import metagraph as mg
 from metagraph import concrete_algorithm, NodeID
-from metagraph.plugins import has_networkx, has_community, has_pandas
+from metagraph.plugins import has_networkx, has_community, has_pandas, has_scipy
 from metagraph.plugins.core import exceptions
+from packaging.version import parse as _parse_version
 from typing import Tuple, Any, Callable
 import random
 
@@ -13,12 +14,19 @@ if has_networkx:
     from ..python.types import PythonNodeMapType, PythonNodeSetType
     from ..numpy.types import NumpyVectorType
 
+    # Before NetworkX 2.6, nx.pagerank is a pure Python loop over dicts and the
+    # much faster sparse matrix version is only available as nx.pagerank_scipy
+    if has_scipy and _parse_version(nx.__version__) < _parse_version("2.6"):
+        _nx_pagerank_func = nx.pagerank_scipy
+    else:
+        _nx_pagerank_func = nx.pagerank
+
     @concrete_algorithm("centrality.pagerank")
     def nx_pagerank(
         graph: NetworkXGraph, damping: float, maxiter: int, tolerance: float
     ) -> PythonNodeMapType:
         try:
-            pagerank = nx.pagerank(
+            pagerank = _nx_pagerank_func(
                 graph.value, alpha=damping, max_iter=maxiter, tol=tolerance, weight=None
             )
         except nx.exception.PowerIterationFailedConvergence:
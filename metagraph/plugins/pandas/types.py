@@ -55,15 +55,15 @@ if has_pandas:
             self._assert(src_label in df, f"Indicated src_label not found: {src_label}")
             self._assert(dst_label in df, f"Indicated dst_label not found: {dst_label}")
             # Build the MultiIndex representing the edges
-            self.index = df.set_index([src_label, dst_label]).index
+            self.index = pd.MultiIndex.from_arrays(
+                [df[src_label].to_numpy(), df[dst_label].to_numpy()],
+                names=[src_label, dst_label],
+            )
 
             if not is_directed:
                 # Ensure no duplicates (ignoring self-loops)
-                rev_index = (
-                    df[df[src_label] != df[dst_label]]
-                    .set_index([dst_label, src_label])
-                    .index
-                )
+                nonself = (df[src_label] != df[dst_label]).to_numpy()
+                rev_index = self.index[nonself].swaplevel(0, 1)
                 dups = self.index.intersection(rev_index)
                 if len(dups) > 0:
                     raise ValueError(
@@ -119,10 +119,8 @@ if has_pandas:
                         obj1.index
                     ), f"edge mismatch {obj1.index.symmetric_difference(obj2.index)}"
                 else:  # undirected
-                    rev1 = g1.set_index([obj1.dst_label, obj1.src_label])
-                    rev2 = g2.set_index([obj2.dst_label, obj2.src_label])
-                    full1 = obj1.index.union(rev1.index)
-                    full2 = obj2.index.union(rev2.index)
+                    full1 = obj1.index.union(obj1.index.swaplevel(0, 1))
+                    full2 = obj2.index.union(obj2.index.swaplevel(0, 1))
                     assert len(full1.intersection(full2)) == len(
                         full1
                     ), f"edge mismatch {full1.symmetric_difference(full2)}"
@@ -166,15 +164,15 @@ if has_pandas:
                 weight_label in df, f"Indicated weight_label not found: {weight_label}"
             )
             # Build the MultiIndex representing the edges
-            self.index = df.set_index([src_label, dst_label]).index
+            self.index = pd.MultiIndex.from_arrays(
+                [df[src_label].to_numpy(), df[dst_label].to_numpy()],
+                names=[src_label, dst_label],
+            )
 
             if not is_directed:
                 # Ensure no duplicates (ignoring self-loops)
-                rev_index = (
-                    df[df[src_label] != df[dst_label]]
-                    .set_index([dst_label, src_label])
-                    .index
-                )
+                nonself = (df[src_label] != df[dst_label]).to_numpy()
+                rev_index = self.index[nonself].swaplevel(0, 1)
                 dups = self.index.intersection(rev_index)
                 if len(dups) > 0:
                     raise ValueError(
@@ -217,8 +215,9 @@ if has_pandas:
                         if ret["dtype"] in {"bool", "str"}:
                             neg_weights = None
                         else:
-                            min_val = obj.value[obj.weight_label].min()
-                            neg_weights = min_val < 0
+                            weights = obj.value[obj.weight_label].to_numpy()
+                            # nanmin matches the NaN-skipping behavior of Series.min
+                            neg_weights = len(weights) > 0 and np.nanmin(weights) < 0
                         ret[prop] = neg_weights
 
                 return ret
@@ -246,36 +245,24 @@ if has_pandas:
                         obj1.index
                     ), f"edge mismatch {obj1.index.symmetric_difference(obj2.index)}"
                 else:  # undirected
-                    rev1 = g1.set_index([obj1.dst_label, obj1.src_label])
-                    rev2 = g2.set_index([obj2.dst_label, obj2.src_label])
-                    full1 = obj1.index.union(rev1.index)
-                    full2 = obj2.index.union(rev2.index)
+                    full1 = obj1.index.union(obj1.index.swaplevel(0, 1))
+                    full2 = obj2.index.union(obj2.index.swaplevel(0, 1))
                     assert len(full1.intersection(full2)) == len(
                         full1
                     ), f"edge mismatch {full1.symmetric_difference(full2)}"
 
-                # Ensure dataframes are indexed the same
-                if not (obj1.index == obj2.index).all():
-                    if aprops1["is_directed"]:
-                        g2 = (
-                            g2.set_index(obj2.index)
-                            .reindex(obj1.index)
-                            .reset_index(drop=True)
-                        )
-                    else:
+                v1 = g1[obj1.weight_label].to_numpy()
+                v2 = g2[obj2.weight_label].to_numpy()
+                # Ensure weights are aligned to the same edge order
+                if not (obj1.index is obj2.index or obj1.index.equals(obj2.index)):
+                    index2 = obj2.index
+                    if not aprops1["is_directed"]:
                         # Add reversed so index can find matching entries
-                        g2_rev = g2.copy()
-                        g2_rev[obj2.src_label] = g2[obj2.dst_label]
-                        g2_rev[obj2.dst_label] = g2[obj2.src_label]
-                        g2_rev = g2_rev[
-                            g2_rev[obj2.src_label] != g2_rev[obj2.dst_label]
-                        ]
-                        g2 = pd.concat([g2, g2_rev])
-                        g2 = g2.set_index([obj2.src_label, obj2.dst_label])
-                        g2 = g2.reindex(obj1.index).reset_index(drop=True)
+                        nonself = (g2[obj2.src_label] != g2[obj2.dst_label]).to_numpy()
+                        index2 = index2.append(index2[nonself].swaplevel(0, 1))
+                        v2 = np.concatenate([v2, v2[nonself]])
+                    v2 = v2[index2.get_indexer(obj1.index)]
                 # Compare
-                v1 = g1[obj1.weight_label]
-                v2 = g2[obj2.weight_label]
                 if issubclass(v1.dtype.type, np.floating):
                     assert np.isclose(v1, v2, rtol=rel_tol, atol=abs_tol).all()
                 else:
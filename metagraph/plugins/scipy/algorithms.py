@@ -3,6 +3,7 @@ import numpy as np
 import metagraph as mg
 from metagraph import concrete_algorithm, NodeID
 from metagraph.plugins import has_scipy
+from metagraph.plugins.core import exceptions
 from .types import ScipyEdgeSet, ScipyEdgeMap, ScipyGraph
 from .. import has_numba
 import numpy as np
@@ -11,6 +12,58 @@ from typing import Tuple, Callable, Any, Union
 if has_numba:
     import numba
 
+    @numba.njit(fastmath=True, cache=True)
+    def _pagerank_step(
+        indptr, indices, inv_out_degree, is_dangling, r, new_r, damping, base
+    ):
+        """
+        Pull-based pagerank update over the CSR in-edges of each node:
+        new_r[i] = base + damping * sum(r[j] / out_degree(j) for each in-neighbor j)
+
+        The L1 change and the dangling node rank of new_r are reduced in the same pass
+        rather than with separate sweeps over the rank vectors.
+        Returns (L1 change, dangling node rank of new_r).
+        """
+        delta = 0.0
+        dangling_sum = 0.0
+        for i in range(len(new_r)):
+            s = 0.0
+            for k in range(indptr[i], indptr[i + 1]):
+                j = indices[k]
+                s += r[j] * inv_out_degree[j]
+            new_r[i] = base + damping * s
+            delta += abs(new_r[i] - r[i])
+            if is_dangling[i]:
+                dangling_sum += new_r[i]
+        return delta, dangling_sum
+
+    @numba.njit(fastmath=True, cache=True)
+    def _pagerank_gauss_seidel_sweep(
+        indptr, indices, inv_out_degree, is_dangling, r, damping, dangling_sum
+    ):
+        """
+        In-place Gauss-Seidel sweep for the pagerank linear system: each node reads the
+        already updated ranks of earlier nodes, and the dangling node rank is kept current.
+        """
+        N = len(r)
+        for i in range(N):
+            s = 0.0
+            diag = 1.0
+            for k in range(indptr[i], indptr[i + 1]):
+                j = indices[k]
+                if j == i:
+                    diag -= damping * inv_out_degree[j]
+                else:
+                    s += r[j] * inv_out_degree[j]
+            if is_dangling[i]:
+                # Move this node's own share of the dangling rank onto the diagonal
+                dangling_sum -= r[i]
+                diag -= damping / N
+            r[i] = ((1 - damping + damping * dangling_sum) / N + damping * s) / diag
+            if is_dangling[i]:
+                dangling_sum += r[i]
+
+
 if has_scipy:
     import scipy.sparse as ss
     from ..numpy.types import NumpyNodeMap, NumpyNodeSet, NumpyVectorType
@@ -80,6 +133,96 @@ if has_scipy:
         U = ss.triu(m, k=1).tocsc()
         return int((L @ U.T).multiply(L).sum())
 
+    @concrete_algorithm("centrality.pagerank")
+    def ss_pagerank(
+        graph: ScipyGraph,
+        damping: float,
+        maxiter: int,
+        tolerance: float,
+        dtype: str = None,
+        method: str = "power",
+    ) -> NumpyNodeMap:
+        """
+        Power iteration where each step is a single sparse matrix-vector product.
+        Edge weights are ignored; rank from dangling nodes is spread evenly over all nodes.
+
+        Iterations are memory-bound, so by default ranks are stored as float32 whenever the
+        requested tolerance is far above float32 rounding error, and as float64 otherwise.
+        Pass dtype="float32" or dtype="float64" to choose explicitly.
+
+        method="gauss_seidel" instead solves the pagerank linear system with in-place
+        Gauss-Seidel sweeps, which typically needs about half as many iterations. The
+        sweeps are sequential loops over every edge, so this method requires numba.
+        """
+        if method not in {"power", "gauss_seidel"}:
+            raise ValueError(
+                f"method must be 'power' or 'gauss_seidel', not {method!r}"
+            )
+        if method == "gauss_seidel" and not has_numba:
+            raise ImportError("method='gauss_seidel' requires numba")
+        A = graph.value.tocsr()
+        N = A.shape[0]
+        if dtype is None:
+            # The L1 rounding error of a float32 rank vector summing to 1 is ~1e-7
+            dtype = "float32" if N * tolerance >= 1e-5 else "float64"
+        dtype = np.dtype(dtype)
+        out_degree = A.getnnz(axis=1)
+        is_dangling = out_degree == 0
+        # Computed once so each iteration multiplies by 1 / out_degree rather than dividing
+        inv_out_degree = np.zeros(N, dtype=dtype)
+        inv_out_degree[~is_dangling] = 1 / out_degree[~is_dangling]
+        # Unweighted in-edges of each node (the transposed adjacency structure)
+        in_edges = ss.csr_matrix(
+            (np.ones(A.nnz, dtype=dtype), A.indices, A.indptr), shape=A.shape
+        ).T.tocsr()
+
+        r = np.full(N, 1 / N, dtype=dtype)
+        new_r = np.empty(N, dtype=dtype)
+        dangling_sum = r[is_dangling].sum(dtype=np.float64)
+        for i in range(maxiter):
+            # `base` gets added to every node: teleportation plus dangling node rank
+            # A Python float so it doesn't promote float32 ranks under NEP 50 casting
+            base = float((1 - damping + damping * dangling_sum) / N)
+            if method == "power" and has_numba:
+                err, dangling_sum = _pagerank_step(
+                    in_edges.indptr,
+                    in_edges.indices,
+                    inv_out_degree,
+                    is_dangling,
+                    r,
+                    new_r,
+                    damping,
+                    base,
+                )
+            else:
+                if method == "gauss_seidel":
+                    new_r[:] = r
+                    _pagerank_gauss_seidel_sweep(
+                        in_edges.indptr,
+                        in_edges.indices,
+                        inv_out_degree,
+                        is_dangling,
+                        new_r,
+                        damping,
+                        dangling_sum,
+                    )
+                    # The solution sums to 1; renormalizing removes the slowly decaying
+                    # error in the total that Gauss-Seidel sweeps otherwise leave behind
+                    new_r /= new_r.sum(dtype=np.float64)
+                else:
+                    new_r = damping * (in_edges @ (r * inv_out_degree)) + base
+                # Accumulate in float64 so the convergence check doesn't drift
+                err = np.abs(new_r - r).sum(dtype=np.float64)
+                dangling_sum = new_r[is_dangling].sum(dtype=np.float64)
+            r, new_r = new_r, r
+            if err < N * tolerance:
+                break
+        else:
+            raise exceptions.ConvergenceError(
+                f"failed to converge within {maxiter} iterations"
+            )
+        return NumpyNodeMap(r, nodes=graph.node_list)
+
     @concrete_algorithm("traversal.bfs_iter")
     def ss_breadth_first_search_iter(
         graph: ScipyGraph, source_node: NodeID, depth_limit: int
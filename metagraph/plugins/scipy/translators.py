@@ -112,18 +112,17 @@ if has_scipy and has_pandas:
         node_list = pd.unique(x.value[[x.src_label, x.dst_label]].values.ravel("K"))
         node_list.sort()
         num_nodes = len(node_list)
-        id2pos = dict(map(reversed, enumerate(node_list)))
-        get_id_pos = lambda node_id: id2pos[node_id]
-        source_positions = x.value[x.src_label].map(get_id_pos)
-        target_positions = x.value[x.dst_label].map(get_id_pos)
-        weights = x.value[x.weight_label]
+        # node_list is sorted, so positions can be found without a per-edge lookup
+        source_positions = np.searchsorted(node_list, x.value[x.src_label].to_numpy())
+        target_positions = np.searchsorted(node_list, x.value[x.dst_label].to_numpy())
+        weights = x.value[x.weight_label].to_numpy()
         if not is_directed:
             nonself = source_positions != target_positions
             source_positions, target_positions = (
-                pd.concat([source_positions, target_positions[nonself]]),
-                pd.concat([target_positions, source_positions[nonself]]),
+                np.concatenate([source_positions, target_positions[nonself]]),
+                np.concatenate([target_positions, source_positions[nonself]]),
             )
-            weights = pd.concat([weights, weights[nonself]])
+            weights = np.concatenate([weights, weights[nonself]])
         matrix = ss.coo_matrix(
             (weights, (source_positions, target_positions)),
             shape=(num_nodes, num_nodes),
@@ -136,15 +135,14 @@ if has_scipy and has_pandas:
         node_list = pd.unique(x.value[[x.src_label, x.dst_label]].values.ravel("K"))
         node_list.sort()
         num_nodes = len(node_list)
-        id2pos = dict(map(reversed, enumerate(node_list)))
-        get_id_pos = lambda node_id: id2pos[node_id]
-        source_positions = x.value[x.src_label].map(get_id_pos)
-        target_positions = x.value[x.dst_label].map(get_id_pos)
+        # node_list is sorted, so positions can be found without a per-edge lookup
+        source_positions = np.searchsorted(node_list, x.value[x.src_label].to_numpy())
+        target_positions = np.searchsorted(node_list, x.value[x.dst_label].to_numpy())
         if not is_directed:
             nonself = source_positions != target_positions
             source_positions, target_positions = (
-                pd.concat([source_positions, target_positions[nonself]]),
-                pd.concat([target_positions, source_positions[nonself]]),
+                np.concatenate([source_positions, target_positions[nonself]]),
+                np.concatenate([target_positions, source_positions[nonself]]),
             )
         matrix = ss.coo_matrix(
             (np.ones(len(source_positions)), (source_positions, target_positions)),
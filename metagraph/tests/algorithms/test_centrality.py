@@ -2,7 +2,7 @@ import pytest
 from metagraph.tests.util import default_plugin_resolver
 import networkx as nx
 import numpy as np
-from metagraph.core.multiverify import MultiVerify, MultiResult
+from metagraph.core.multiverify import MultiVerify, MultiResult, ensure_computed
 from metagraph.plugins.networkx.types import NetworkXGraph
 from metagraph.plugins.core.exceptions import ConvergenceError
 
@@ -189,6 +189,63 @@ def test_pagerank_centrality(default_plugin_resolver):
     MultiResult(mv, value_comp_results).assert_equal(expected_val, rel_tol=1e-9)
 
 
+def test_pagerank_centrality_scipy_options(default_plugin_resolver):
+    dpr = default_plugin_resolver
+    networkx_graph = nx.DiGraph()
+    networkx_graph.add_weighted_edges_from(
+        [
+            (0, 1, 1),
+            (0, 2, 1),
+            (2, 0, 1),
+            (1, 2, 1),
+            (3, 2, 1),
+            (2, 4, 1),
+            (4, 4, 1),
+            (2, 5, 1),
+        ]
+    )
+    expected = nx.pagerank(networkx_graph, tol=1e-12, max_iter=1000, weight=None)
+    graph = dpr.translate(
+        dpr.wrappers.Graph.NetworkXGraph(networkx_graph), dpr.types.Graph.ScipyGraphType
+    )
+    pagerank = dpr.algos.centrality.pagerank.core_scipy
+    for dtype, rel_tol in [("float32", 1e-5), ("float64", 1e-8)]:
+        for method in ["power", "gauss_seidel"]:
+            result = ensure_computed(
+                pagerank(
+                    graph, tolerance=1e-10, maxiter=1000, dtype=dtype, method=method
+                )
+            )
+            assert result.value.dtype == dtype
+            for node, val in zip(result.nodes, result.value):
+                assert val == pytest.approx(expected[node], rel=rel_tol)
+    with pytest.raises(ValueError, match="method"):
+        ensure_computed(pagerank(graph, method="jacobi"))
+
+
+def test_pagerank_centrality_scipy_without_numba(default_plugin_resolver, monkeypatch):
+    dpr = default_plugin_resolver
+    monkeypatch.setattr("metagraph.plugins.scipy.algorithms.has_numba", False)
+    networkx_graph = nx.DiGraph()
+    networkx_graph.add_weighted_edges_from(
+        [(0, 1, 1), (0, 2, 1), (2, 0, 1), (1, 2, 1), (3, 2, 1), (2, 5, 1), (4, 4, 1)]
+    )
+    expected = nx.pagerank(networkx_graph, tol=1e-12, max_iter=1000, weight=None)
+    graph = dpr.translate(
+        dpr.wrappers.Graph.NetworkXGraph(networkx_graph), dpr.types.Graph.ScipyGraphType
+    )
+    pagerank = dpr.algos.centrality.pagerank.core_scipy
+    for dtype, rel_tol in [("float32", 1e-5), ("float64", 1e-8)]:
+        result = ensure_computed(
+            pagerank(graph, tolerance=1e-10, maxiter=1000, dtype=dtype, method="power")
+        )
+        assert result.value.dtype == dtype
+        for node, val in zip(result.nodes, result.value):
+            assert val == pytest.approx(expected[node], rel=rel_tol)
+    with pytest.raises(ImportError, match="numba"):
+        ensure_computed(pagerank(graph, method="gauss_seidel"))
+
+
 def test_closeness_centrality(default_plugin_resolver):
     dpr = default_plugin_resolver
     graph = build_standard_graph(directed=False)